@@ -29,10 +29,12 @@ from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Generator, List
 from . import enums, flags, utils
 from .asset import Asset
 from .colour import Colour
+from .enums import create_unknown_value, try_enum
 from .invite import Invite
 from .mixins import Hashable
 from .object import Object
 from .permissions import PermissionOverwrite, Permissions
+from .utils import MISSING, _get_as_snowflake, parse_time
 
 __all__ = (
     'AuditLogDiff',
@@ -52,6 +54,7 @@ if TYPE_CHECKING:
     from .scheduled_event import ScheduledEvent
     from .state import ConnectionState
     from .types.audit_log import (
+        AuditEntryInfo as AuditEntryInfoPayload,
         AuditLogChange as AuditLogChangePayload,
         AuditLogEntry as AuditLogEntryPayload,
     )
@@ -75,7 +78,7 @@ if TYPE_CHECKING:
 
 
 def _transform_timestamp(entry: AuditLogEntry, data: Optional[str]) -> Optional[datetime.datetime]:
-    return utils.parse_time(data)
+    return parse_time(data)
 
 
 def _transform_color(entry: AuditLogEntry, data: int) -> Colour:
@@ -89,7 +92,8 @@ def _transform_snowflake(entry: AuditLogEntry, data: Snowflake) -> int:
 def _transform_channel(entry: AuditLogEntry, data: Optional[Snowflake]) -> Optional[Union[abc.GuildChannel, Object]]:
     if data is None:
         return None
-    return entry.guild.get_channel(int(data)) or Object(id=data)
+    channel_id = int(data)
+    return entry.guild.get_channel(channel_id) or entry._get_object(channel_id)
 
 
 def _transform_member_id(entry: AuditLogEntry, data: Optional[Snowflake]) -> Union[Member, User, None]:
@@ -107,24 +111,31 @@ def _transform_guild_id(entry: AuditLogEntry, data: Optional[Snowflake]) -> Opti
 def _transform_overwrites(
     entry: AuditLogEntry, data: List[PermissionOverwritePayload]
 ) -> List[Tuple[Object, PermissionOverwrite]]:
+    # bind the lookups once, this is called with every overwrite of the channel
+    get_role = entry.guild.get_role
+    get_member = entry._get_member
+    get_object = entry._get_object
+    from_pair = PermissionOverwrite.from_pair
+
     overwrites = []
+    append = overwrites.append
     for elem in data:
-        allow = Permissions(int(elem['allow']))
-        deny = Permissions(int(elem['deny']))
-        ow = PermissionOverwrite.from_pair(allow, deny)
+        ow = from_pair(Permissions(int(elem['allow'])), Permissions(int(elem['deny'])))
 
-        ow_type = elem['type']
+        # the type can be sent as either a string or an int
+        ow_type = int(elem['type'])
         ow_id = int(elem['id'])
-        target = None
-        if ow_type == '0':
-            target = entry.guild.get_role(ow_id)
-        elif ow_type == '1':
-            target = entry._get_member(ow_id)
+        if ow_type == 0:
+            target = get_role(ow_id)
+        elif ow_type == 1:
+            target = get_member(ow_id)
+        else:
+            target = None
 
         if target is None:
-            target = Object(id=ow_id)
+            target = get_object(ow_id)
 
-        overwrites.append((target, ow))
+        append((target, ow))
 
     return overwrites
 
@@ -163,8 +174,14 @@ E = TypeVar('E', bound=enums.Enum)
 
 
 def _enum_transformer(enum: Type[E]) -> Callable[[AuditLogEntry, int], E]:
+    # this is try_enum specialised for a single enum, to save a call per change
+    value_map = enum._enum_value_map_  # type: ignore # Runtime attribute isn't understood
+
     def _transform(entry: AuditLogEntry, data: int) -> E:
-        return enums.try_enum(enum, data)
+        try:
+            return value_map[data]
+        except (KeyError, TypeError):
+            return create_unknown_value(enum, data)
 
     return _transform
 
@@ -173,17 +190,19 @@ F = TypeVar('F', bound=flags.BaseFlags)
 
 
 def _flag_transformer(cls: Type[F]) -> Callable[[AuditLogEntry, Union[int, str]], F]:
+    from_value = cls._from_value
+
     def _transform(entry: AuditLogEntry, data: Union[int, str]) -> F:
-        return cls._from_value(int(data))
+        return from_value(int(data))
 
     return _transform
 
 
 def _transform_type(entry: AuditLogEntry, data: int) -> Union[enums.ChannelType, enums.StickerType]:
     if entry.action.name.startswith('sticker_'):
-        return enums.try_enum(enums.StickerType, data)
+        return try_enum(enums.StickerType, data)
     else:
-        return enums.try_enum(enums.ChannelType, data)
+        return try_enum(enums.ChannelType, data)
 
 
 class AuditLogDiff:
@@ -208,6 +227,8 @@ class AuditLogDiff:
 
 Transformer = Callable[["AuditLogEntry", Any], Any]
 
+_NO_TRANSFORMER: Tuple[Optional[str], Optional[Transformer]] = (None, None)
+
 
 class AuditLogChanges:
     # fmt: off
@@ -255,73 +276,84 @@ class AuditLogChanges:
     def __init__(self, entry: AuditLogEntry, data: List[AuditLogChangePayload]):
         self.before: AuditLogDiff = AuditLogDiff()
         self.after: AuditLogDiff = AuditLogDiff()
+        # this loop runs for every change of every entry, so keep the lookups local
+        before_diff = self.before
+        after_diff = self.after
 
         if entry.action is enums.AuditLogAction.app_command_permission_update:
             # special case entire process since each
             # element in data is a different target
-            self.before.app_command_permissions = []
-            self.after.app_command_permissions = []
+            count = len(data)
+            before_permissions: List[Any] = [None] * count
+            after_permissions: List[Any] = [None] * count
 
-            for d in data:
+            for index, d in enumerate(data):
 
                 self._handle_app_command_permissions(
-                    self.before,
-                    self.after,
+                    before_permissions,
+                    after_permissions,
+                    index,
                     entry,
                     int(d['key']),
                     d.get('old_value'),  # type: ignore # old value will be an ApplicationCommandPermissions if present
                     d.get('new_value'),  # type: ignore # new value will be an ApplicationCommandPermissions if present
                 )
+
+            # targets without an old or new value leave their slot empty
+            if None in before_permissions:
+                before_permissions = [p for p in before_permissions if p is not None]
+            if None in after_permissions:
+                after_permissions = [p for p in after_permissions if p is not None]
+
+            before_diff.app_command_permissions = before_permissions
+            after_diff.app_command_permissions = after_permissions
             return
 
+        get_transformer = self.TRANSFORMERS.get
+        # the $add and $remove keys are only sent for member role updates
+        has_role_changes = entry.action is enums.AuditLogAction.member_role_update
+
         for elem in data:
             attr = elem['key']
 
             # special cases for role add/remove
-            if attr == '$add':
-                self._handle_role(self.before, self.after, entry, elem['new_value'])  # type: ignore # new_value is a list of roles in this case
-                continue
-            elif attr == '$remove':
-                self._handle_role(self.after, self.before, entry, elem['new_value'])  # type: ignore # new_value is a list of roles in this case
-                continue
-
-            try:
-                key, transformer = self.TRANSFORMERS[attr]
-            except (ValueError, KeyError):
-                transformer = None
-            else:
-                if key:
-                    attr = key
-
-            transformer: Optional[Transformer]
-
-            try:
-                before = elem['old_value']
-            except KeyError:
+            if has_role_changes:
+                if attr == '$add':
+                    self._handle_role(before_diff, after_diff, entry, elem['new_value'])  # type: ignore # new_value is a list of roles in this case
+                    continue
+                elif attr == '$remove':
+                    self._handle_role(after_diff, before_diff, entry, elem['new_value'])  # type: ignore # new_value is a list of roles in this case
+                    continue
+
+            key, transformer = get_transformer(attr, _NO_TRANSFORMER)
+            if key:
+                attr = key
+
+            before = elem.get('old_value', MISSING)
+            if before is MISSING:
                 before = None
-            else:
-                if transformer:
-                    before = transformer(entry, before)
+            elif transformer:
+                before = transformer(entry, before)
 
-            setattr(self.before, attr, before)
+            setattr(before_diff, attr, before)
 
-            try:
-                after = elem['new_value']
-            except KeyError:
+            after = elem.get('new_value', MISSING)
+            if after is MISSING:
                 after = None
-            else:
-                if transformer:
-                    after = transformer(entry, after)
+            elif transformer:
+                after = transformer(entry, after)
 
-            setattr(self.after, attr, after)
+            setattr(after_diff, attr, after)
 
         # add an alias
-        if hasattr(self.after, 'colour'):
-            self.after.color = self.after.colour
-            self.before.color = self.before.colour
-        if hasattr(self.after, 'expire_behavior'):
-            self.after.expire_behaviour = self.after.expire_behavior
-            self.before.expire_behaviour = self.before.expire_behavior
+        colour = getattr(after_diff, 'colour', MISSING)
+        if colour is not MISSING:
+            after_diff.color = colour
+            before_diff.color = before_diff.colour
+        expire_behavior = getattr(after_diff, 'expire_behavior', MISSING)
+        if expire_behavior is not MISSING:
+            after_diff.expire_behaviour = expire_behavior
+            before_diff.expire_behaviour = before_diff.expire_behavior
 
     def __repr__(self) -> str:
         return f'<AuditLogChanges before={self.before!r} after={self.after!r}>'
@@ -330,25 +362,26 @@ class AuditLogChanges:
         if not hasattr(first, 'roles'):
             setattr(first, 'roles', [])
 
-        data = []
-        g: Guild = entry.guild
+        get_role = entry.guild.get_role
+        data: List[Union[Role, Object]] = [None] * len(elem)  # type: ignore # every slot is filled below
 
-        for e in elem:
+        for i, e in enumerate(elem):
             role_id = int(e['id'])
-            role = g.get_role(role_id)
+            role = get_role(role_id)
 
             if role is None:
                 role = Object(id=role_id)
                 role.name = e['name']  # type: ignore # Object doesn't usually have name
 
-            data.append(role)
+            data[i] = role
 
         setattr(second, 'roles', data)
 
     def _handle_app_command_permissions(
         self,
-        before: AuditLogDiff,
-        after: AuditLogDiff,
+        before: List[Any],
+        after: List[Any],
+        index: int,
         entry: AuditLogEntry,
         target_id: int,
         old_value: Optional[ApplicationCommandPermissions],
@@ -381,43 +414,55 @@ class AuditLogChanges:
                 target = guild.get_channel(target_id)
 
         if target is None:
-            target = Object(target_id)
+            target = entry._get_object(target_id)
 
         if old_value is not None:
             old_permission = old_value['permission']
-            before.app_command_permissions.append((target, old_permission))
+            before[index] = (target, old_permission)
 
         if new_value is not None:
             new_permission = new_value['permission']
-            after.app_command_permissions.append((target, new_permission))
+            after[index] = (target, new_permission)
 
 
 class _AuditLogProxy:
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         for k, v in kwargs.items():
             setattr(self, k, v)
 
 
 class _AuditLogProxyMemberPrune(_AuditLogProxy):
+    __slots__ = ('delete_member_days', 'members_removed')
+
     delete_member_days: int
     members_removed: int
 
 
 class _AuditLogProxyMemberMoveOrMessageDelete(_AuditLogProxy):
+    __slots__ = ('channel', 'count')
+
     channel: Union[abc.GuildChannel, Thread]
     count: int
 
 
 class _AuditLogProxyMemberDisconnect(_AuditLogProxy):
+    __slots__ = ('count',)
+
     count: int
 
 
 class _AuditLogProxyPinAction(_AuditLogProxy):
+    __slots__ = ('channel', 'message_id')
+
     channel: Union[abc.GuildChannel, Thread]
     message_id: int
 
 
 class _AuditLogProxyStageInstanceAction(_AuditLogProxy):
+    __slots__ = ('channel',)
+
     channel: abc.GuildChannel
 
 
@@ -464,11 +509,36 @@ class AuditLogEntry(Hashable):
         which actions have this field filled out.
     """
 
+    __slots__: Tuple[str, ...] = (
+        '_state',
+        'guild',
+        '_users',
+        '_integrations',
+        '_integrations_by_app_id',
+        '_app_commands',
+        '_objects',
+        'action',
+        'id',
+        'reason',
+        'extra',
+        '_changes',
+        'user',
+        '_target_id',
+        '_cs_created_at',
+        '_cs_target',
+        '_cs_category',
+        '_cs_changes',
+        '_cs_before',
+        '_cs_after',
+    )
+
     def __init__(
         self,
         *,
         users: Dict[int, User],
         integrations: Dict[int, PartialIntegration],
+        integrations_by_app_id: Dict[int, PartialIntegration],
+        objects: Dict[int, Object],
         app_commands: Dict[int, AppCommand],
         data: AuditLogEntryPayload,
         guild: Guild,
@@ -477,11 +547,14 @@ class AuditLogEntry(Hashable):
         self.guild: Guild = guild
         self._users: Dict[int, User] = users
         self._integrations: Dict[int, PartialIntegration] = integrations
+        self._integrations_by_app_id: Dict[int, PartialIntegration] = integrations_by_app_id
         self._app_commands: Dict[int, AppCommand] = app_commands
+        self._objects: Dict[int, Object] = objects
         self._from_data(data)
 
     def _from_data(self, data: AuditLogEntryPayload) -> None:
-        self.action: enums.AuditLogAction = enums.try_enum(enums.AuditLogAction, data['action_type'])
+        action = try_enum(enums.AuditLogAction, data['action_type'])
+        self.action: enums.AuditLogAction = action
         self.id: int = int(data['id'])
 
         # this key is technically not usually present
@@ -500,49 +573,9 @@ class AuditLogEntry(Hashable):
         ] = None
         # fmt: on
 
-        if isinstance(self.action, enums.AuditLogAction) and extra:
-            if self.action is enums.AuditLogAction.member_prune:
-                # member prune has two keys with useful information
-                self.extra = _AuditLogProxyMemberPrune(
-                    delete_member_days=int(extra['delete_member_days']),
-                    members_removed=int(extra['members_removed']),
-                )
-            elif self.action is enums.AuditLogAction.member_move or self.action is enums.AuditLogAction.message_delete:
-                channel_id = int(extra['channel_id'])
-                self.extra = _AuditLogProxyMemberMoveOrMessageDelete(
-                    count=int(extra['count']),
-                    channel=self.guild.get_channel_or_thread(channel_id) or Object(id=channel_id),
-                )
-            elif self.action is enums.AuditLogAction.member_disconnect:
-                # The member disconnect action has a dict with some information
-                self.extra = _AuditLogProxyMemberDisconnect(count=int(extra['count']))
-            elif self.action.name.endswith('pin'):
-                # the pin actions have a dict with some information
-                channel_id = int(extra['channel_id'])
-                self.extra = _AuditLogProxyPinAction(
-                    channel=self.guild.get_channel_or_thread(channel_id) or Object(id=channel_id),
-                    message_id=int(extra['message_id']),
-                )
-            elif self.action.name.startswith('overwrite_'):
-                # the overwrite_ actions have a dict with some information
-                instance_id = int(extra['id'])
-                the_type = extra.get('type')
-                if the_type == '1':
-                    self.extra = self._get_member(instance_id)
-                elif the_type == '0':
-                    role = self.guild.get_role(instance_id)
-                    if role is None:
-                        role = Object(id=instance_id)
-                        role.name = extra.get('role_name')  # type: ignore # Object doesn't usually have name
-                    self.extra = role
-            elif self.action.name.startswith('stage_instance'):
-                channel_id = int(extra['channel_id'])
-                self.extra = _AuditLogProxyStageInstanceAction(
-                    channel=self.guild.get_channel(channel_id) or Object(id=channel_id)
-                )
-            elif self.action.name.startswith('app_command'):
-                application_id = int(extra['application_id'])
-                self.extra = self._get_integration_by_app_id(application_id) or Object(application_id)
+        handler = _EXTRA_HANDLERS.get(action)
+        if handler is not None and extra:
+            self.extra = handler(self, extra)
 
         # this key is not present when the above is present, typically.
         # It's a list of { new_value: a, old_value: b, key: c }
@@ -551,9 +584,57 @@ class AuditLogEntry(Hashable):
         # into meaningful data when requested
         self._changes = data.get('changes', [])
 
-        user_id = utils._get_as_snowflake(data, 'user_id')
+        user_id = _get_as_snowflake(data, 'user_id')
         self.user: Optional[Union[User, Member]] = self._get_member(user_id)
-        self._target_id = utils._get_as_snowflake(data, 'target_id')
+        self._target_id = _get_as_snowflake(data, 'target_id')
+
+    def _extra_member_prune(self, extra: AuditEntryInfoPayload) -> _AuditLogProxyMemberPrune:
+        # member prune has two keys with useful information
+        return _AuditLogProxyMemberPrune(
+            delete_member_days=int(extra['delete_member_days']),
+            members_removed=int(extra['members_removed']),
+        )
+
+    def _extra_member_move_or_message_delete(self, extra: AuditEntryInfoPayload) -> _AuditLogProxyMemberMoveOrMessageDelete:
+        channel_id = int(extra['channel_id'])
+        return _AuditLogProxyMemberMoveOrMessageDelete(
+            count=int(extra['count']),
+            channel=self.guild.get_channel_or_thread(channel_id) or self._get_object(channel_id),
+        )
+
+    def _extra_member_disconnect(self, extra: AuditEntryInfoPayload) -> _AuditLogProxyMemberDisconnect:
+        # The member disconnect action has a dict with some information
+        return _AuditLogProxyMemberDisconnect(count=int(extra['count']))
+
+    def _extra_pin_action(self, extra: AuditEntryInfoPayload) -> _AuditLogProxyPinAction:
+        # the pin actions have a dict with some information
+        channel_id = int(extra['channel_id'])
+        return _AuditLogProxyPinAction(
+            channel=self.guild.get_channel_or_thread(channel_id) or self._get_object(channel_id),
+            message_id=int(extra['message_id']),
+        )
+
+    def _extra_overwrite_action(self, extra: AuditEntryInfoPayload) -> Union[Member, User, Role, Object, None]:
+        # the overwrite_ actions have a dict with some information
+        instance_id = int(extra['id'])
+        the_type = int(extra.get('type', -1))
+        if the_type == 1:
+            return self._get_member(instance_id)
+        elif the_type == 0:
+            role = self.guild.get_role(instance_id)
+            if role is None:
+                role = Object(id=instance_id)
+                role.name = extra.get('role_name')  # type: ignore # Object doesn't usually have name
+            return role
+        return None
+
+    def _extra_stage_instance_action(self, extra: AuditEntryInfoPayload) -> _AuditLogProxyStageInstanceAction:
+        channel_id = int(extra['channel_id'])
+        return _AuditLogProxyStageInstanceAction(channel=self.guild.get_channel(channel_id) or self._get_object(channel_id))
+
+    def _extra_app_command_action(self, extra: AuditEntryInfoPayload) -> Union[PartialIntegration, Object]:
+        application_id = int(extra['application_id'])
+        return self._get_integration_by_app_id(application_id) or self._get_object(application_id)
 
     def _get_member(self, user_id: Optional[int]) -> Union[Member, User, None]:
         if user_id is None:
@@ -561,6 +642,14 @@ class AuditLogEntry(Hashable):
 
         return self.guild.get_member(user_id) or self._users.get(user_id)
 
+    def _get_object(self, object_id: int) -> Object:
+        # Objects for uncached models are shared by every entry of the same page
+        try:
+            return self._objects[object_id]
+        except KeyError:
+            obj = self._objects[object_id] = Object(id=object_id)
+            return obj
+
     def _get_integration(self, integration_id: Optional[int]) -> Optional[PartialIntegration]:
         if integration_id is None:
             return None
@@ -571,8 +660,7 @@ class AuditLogEntry(Hashable):
         if application_id is None:
             return None
 
-        # get PartialIntegration by application id
-        return utils.get(self._integrations.values(), application_id=application_id)
+        return self._integrations_by_app_id.get(application_id)
 
     def _get_app_command(self, app_command_id: Optional[int]) -> Optional[AppCommand]:
         if app_command_id is None:
@@ -583,43 +671,42 @@ class AuditLogEntry(Hashable):
     def __repr__(self) -> str:
         return f'<AuditLogEntry id={self.id} action={self.action} user={self.user!r}>'
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_created_at')
     def created_at(self) -> datetime.datetime:
         """:class:`datetime.datetime`: Returns the entry's creation time in UTC."""
         return utils.snowflake_time(self.id)
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_target')
     def target(self) -> TargetType:
-        if self.action.target_type is None:
+        target_type = self.action.target_type
+        if target_type is None:
             return None
 
-        try:
-            converter = getattr(self, '_convert_target_' + self.action.target_type)
-        except AttributeError:
+        converter = _TARGET_CONVERTERS.get(target_type)
+        if converter is None:
             if self._target_id is None:
                 return None
-            return Object(id=self._target_id)
-        else:
-            return converter(self._target_id)
+            return self._get_object(self._target_id)
+        return converter(self, self._target_id)
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_category')
     def category(self) -> Optional[enums.AuditLogActionCategory]:
         """Optional[:class:`AuditLogActionCategory`]: The category of the action, if applicable."""
         return self.action.category
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_changes')
     def changes(self) -> AuditLogChanges:
         """:class:`AuditLogChanges`: The list of changes this entry has."""
         obj = AuditLogChanges(self, self._changes)
         del self._changes
         return obj
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_before')
     def before(self) -> AuditLogDiff:
         """:class:`AuditLogDiff`: The target's prior state."""
         return self.changes.before
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_after')
     def after(self) -> AuditLogDiff:
         """:class:`AuditLogDiff`: The target's subsequent state."""
         return self.changes.after
@@ -628,13 +715,13 @@ class AuditLogEntry(Hashable):
         return self.guild
 
     def _convert_target_channel(self, target_id: int) -> Union[abc.GuildChannel, Object]:
-        return self.guild.get_channel(target_id) or Object(id=target_id)
+        return self.guild.get_channel(target_id) or self._get_object(target_id)
 
     def _convert_target_user(self, target_id: int) -> Union[Member, User, None]:
         return self._get_member(target_id)
 
     def _convert_target_role(self, target_id: int) -> Union[Role, Object]:
-        return self.guild.get_role(target_id) or Object(id=target_id)
+        return self.guild.get_role(target_id) or self._get_object(target_id)
 
     def _convert_target_invite(self, target_id: None) -> Invite:
         # invites have target_id set to null
@@ -658,28 +745,62 @@ class AuditLogEntry(Hashable):
         return obj
 
     def _convert_target_emoji(self, target_id: int) -> Union[Emoji, Object]:
-        return self._state.get_emoji(target_id) or Object(id=target_id)
+        return self._state.get_emoji(target_id) or self._get_object(target_id)
 
     def _convert_target_message(self, target_id: int) -> Union[Member, User, None]:
         return self._get_member(target_id)
 
     def _convert_target_stage_instance(self, target_id: int) -> Union[StageInstance, Object]:
-        return self.guild.get_stage_instance(target_id) or Object(id=target_id)
+        return self.guild.get_stage_instance(target_id) or self._get_object(target_id)
 
     def _convert_target_sticker(self, target_id: int) -> Union[GuildSticker, Object]:
-        return self._state.get_sticker(target_id) or Object(id=target_id)
+        return self._state.get_sticker(target_id) or self._get_object(target_id)
 
     def _convert_target_thread(self, target_id: int) -> Union[Thread, Object]:
-        return self.guild.get_thread(target_id) or Object(id=target_id)
+        return self.guild.get_thread(target_id) or self._get_object(target_id)
 
     def _convert_target_guild_scheduled_event(self, target_id: int) -> Union[ScheduledEvent, Object]:
-        return self.guild.get_scheduled_event(target_id) or Object(id=target_id)
+        return self.guild.get_scheduled_event(target_id) or self._get_object(target_id)
 
     def _convert_target_integration(self, target_id: int) -> Union[PartialIntegration, Object]:
-        return self._get_integration(target_id) or Object(target_id)
+        return self._get_integration(target_id) or self._get_object(target_id)
 
     def _convert_target_app_command(self, target_id: int) -> Union[AppCommand, Object]:
-        return self._get_app_command(target_id) or Object(target_id)
+        return self._get_app_command(target_id) or self._get_object(target_id)
 
     def _convert_target_integration_or_app_command(self, target_id: int) -> Union[PartialIntegration, AppCommand, Object]:
-        return self._get_integration_by_app_id(target_id) or self._get_app_command(target_id) or Object(target_id)
+        return self._get_integration_by_app_id(target_id) or self._get_app_command(target_id) or self._get_object(target_id)
+
+
+def _build_extra_handlers() -> Dict[enums.AuditLogAction, Callable[[AuditLogEntry, Any], Any]]:
+    # Resolved once at import time so that parsing an entry is a single dict lookup
+    # rather than a cascade of identity and name prefix checks.
+    handlers: Dict[enums.AuditLogAction, Callable[[AuditLogEntry, Any], Any]] = {
+        enums.AuditLogAction.member_prune: AuditLogEntry._extra_member_prune,
+        enums.AuditLogAction.member_move: AuditLogEntry._extra_member_move_or_message_delete,
+        enums.AuditLogAction.message_delete: AuditLogEntry._extra_member_move_or_message_delete,
+        enums.AuditLogAction.member_disconnect: AuditLogEntry._extra_member_disconnect,
+    }
+
+    for action in enums.AuditLogAction:
+        name = action.name
+        if name.endswith('pin'):
+            handlers[action] = AuditLogEntry._extra_pin_action
+        elif name.startswith('overwrite_'):
+            handlers[action] = AuditLogEntry._extra_overwrite_action
+        elif name.startswith('stage_instance'):
+            handlers[action] = AuditLogEntry._extra_stage_instance_action
+        elif name.startswith('app_command'):
+            handlers[action] = AuditLogEntry._extra_app_command_action
+
+    return handlers
+
+
+_EXTRA_HANDLERS = _build_extra_handlers()
+
+# maps AuditLogAction.target_type to the _convert_target_* method resolving the target
+_TARGET_CONVERTERS: Dict[str, Callable[[AuditLogEntry, Any], Any]] = {
+    name[len('_convert_target_') :]: func
+    for name, func in vars(AuditLogEntry).items()
+    if name.startswith('_convert_target_')
+}
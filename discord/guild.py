@@ -3419,10 +3419,18 @@ class Guild(Hashable):
 
             integrations = (PartialIntegration(data=raw_i, guild=self) for raw_i in data.get('integrations', []))
             integration_map = {integration.id: integration for integration in integrations}
+            # keep the first integration per application, like utils.get would
+            integration_app_id_map: Dict[int, PartialIntegration] = {}
+            for integration in integration_map.values():
+                if integration.application_id is not None:
+                    integration_app_id_map.setdefault(integration.application_id, integration)
 
             app_commands = (AppCommand(data=raw_cmd, state=self._state) for raw_cmd in data.get('application_commands', []))
             app_command_map = {app_command.id: app_command for app_command in app_commands}
 
+            # placeholder Objects for uncached models, shared across the entries of this page
+            object_map: Dict[int, Object] = {}
+
             for raw_entry in raw_entries:
                 # Weird Discord quirk
                 if raw_entry['action_type'] is None:
@@ -3432,6 +3440,8 @@ class Guild(Hashable):
                     data=raw_entry,
                     users=user_map,
                     integrations=integration_map,
+                    integrations_by_app_id=integration_app_id_map,
+                    objects=object_map,
                     app_commands=app_command_map,
                     guild=self,
                 )
@@ -0,0 +1,119 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import discord
+from discord.audit_logs import AuditLogChanges, _transform_overwrites
+
+
+class FakeGuild:
+    id = 1000
+
+    def __init__(self, roles):
+        self.roles = roles
+
+    def get_role(self, role_id):
+        return self.roles.get(role_id)
+
+
+class FakeEntry:
+    def __init__(self, roles=None, members=None, action=discord.AuditLogAction.guild_update, target_id=None):
+        self.guild = FakeGuild(roles or {})
+        self.members = members or {}
+        self.action = action
+        self._target_id = target_id
+        self._state = None
+
+    def _get_member(self, user_id):
+        return self.members.get(user_id)
+
+    def _get_object(self, object_id):
+        return discord.Object(id=object_id)
+
+
+@pytest.mark.parametrize('ow_type', ['0', 0])
+def test_transform_overwrites_role(ow_type):
+    role = object()
+    entry = FakeEntry(roles={10: role}, members={})
+    data = [{'id': '10', 'type': ow_type, 'allow': '8', 'deny': '0'}]
+
+    ((target, overwrite),) = _transform_overwrites(entry, data)  # type: ignore
+
+    assert target is role
+    assert overwrite.pair() == (discord.Permissions(8), discord.Permissions(0))
+
+
+@pytest.mark.parametrize('ow_type', ['1', 1])
+def test_transform_overwrites_member(ow_type):
+    member = object()
+    entry = FakeEntry(roles={}, members={20: member})
+    data = [{'id': '20', 'type': ow_type, 'allow': '0', 'deny': '8'}]
+
+    ((target, overwrite),) = _transform_overwrites(entry, data)  # type: ignore
+
+    assert target is member
+    assert overwrite.pair() == (discord.Permissions(0), discord.Permissions(8))
+
+
+@pytest.mark.parametrize('ow_type', ['1', 1])
+def test_transform_overwrites_uncached_target(ow_type):
+    entry = FakeEntry(roles={}, members={})
+    data = [{'id': '30', 'type': ow_type, 'allow': '0', 'deny': '0'}]
+
+    ((target, _),) = _transform_overwrites(entry, data)  # type: ignore
+
+    assert isinstance(target, discord.Object)
+    assert target.id == 30
+
+
+@pytest.mark.parametrize(
+    ('action', 'expected'),
+    [
+        (discord.AuditLogAction.sticker_update, discord.StickerType.guild),
+        (discord.AuditLogAction.channel_update, discord.ChannelType.voice),
+    ],
+)
+def test_changes_type_depends_on_action(action, expected):
+    entry = FakeEntry(action=action)
+    changes = AuditLogChanges(entry, [{'key': 'type', 'new_value': 2}])  # type: ignore
+
+    assert changes.after.type is expected
+
+
+@pytest.mark.parametrize(
+    ('action', 'target_id', 'expected'),
+    [
+        (discord.AuditLogAction.guild_update, 1000, '/icons/1000/abc.png'),
+        (discord.AuditLogAction.role_update, 20, '/role-icons/20/abc.png'),
+    ],
+)
+def test_changes_icon_depends_on_action(action, target_id, expected):
+    entry = FakeEntry(action=action, target_id=target_id)
+    changes = AuditLogChanges(entry, [{'key': 'icon_hash', 'old_value': None, 'new_value': 'abc'}])  # type: ignore
+
+    assert changes.before.icon is None
+    assert changes.after.icon.url.endswith(expected + '?size=1024')